@@ -1,10 +1,12 @@
-import numpy as np
+import argparse
 import random
-from src.core.gwo import GWO
+
+import numpy as np
+
+from src.core.benchmark import DEFAULT_BENCHMARK, OPTIMIZERS, benchmark, make_optimizer, print_benchmark
+from src.core.gwo import GreyWolfOptimizer
+from src.core.kernels import BACKENDS
 from src.core.uav_setup import UAV_SetUp
-from src.core.obj_fun import ObjFun
-from src.utils.export import export_animation_data
-from src.visualization.animation import PathAnimator, save_animation
 
 
 def set_seed(seed=None):
@@ -16,45 +18,214 @@ def set_seed(seed=None):
     return seed
 
 
-def main():
-    # Algorithm parameters
-    SearchAgents = 200
-    Max_iter = 100
+def dynamic_g_type(value):
+    return value if value == "auto" else float(value)
+
 
-    # Setup
+def add_run_arguments(parser):
+    """Algorithm parameters shared by plan and export."""
+    parser.add_argument("-a", "--algorithm", choices=OPTIMIZERS, default="gwo")
+    parser.add_argument("-n", "--agents", type=int, default=200, help="SearchAgents")
+    parser.add_argument("-i", "--iters", type=int, default=100, help="Max_iter")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--points", type=int, default=None, help="UAV PointNum")
+    parser.add_argument("--dynamic-g", type=dynamic_g_type, default=None, help='number or "auto"')
+    parser.add_argument("--workers", type=int, default=None, help="fitness evaluation processes")
+    parser.add_argument("--islands", type=int, default=None, help="run an island model")
+    parser.add_argument("--multires", action="store_true", help="coarse-to-fine waypoints")
+    parser.add_argument("--refine", action="store_true", help="polish the best path")
+    parser.add_argument("--save-images", action="store_true", help="save iteration images")
+    parser.add_argument("--restart-threshold", type=float, default=None, help="re-seed below this diversity")
+    parser.add_argument("--restart-fraction", type=float, default=None, help="share of wolves re-seeded (0.2)")
+    parser.add_argument("--stop-diversity", type=float, default=None, help="stop below this diversity")
+    parser.add_argument("--float32", action="store_true", help="memory-lean float32 population")
+    parser.add_argument("--backend", choices=BACKENDS, default="numpy", help="fitness/update kernels")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file to save/resume")
+    parser.add_argument("--checkpoint-every", type=int, default=10, help="iterations between checkpoints")
+
+
+def check_run_arguments(parser, args):
+    """Reject option combinations that the selected algorithm would not honor."""
+    cls, defaults = OPTIMIZERS[args.algorithm]
+    if args.dynamic_g is not None and (
+        not issubclass(cls, GreyWolfOptimizer) or args.algorithm == "mogwo" or defaults.get("is_normal", True)
+    ):
+        # Only the improved variants use the dynamic weighted average
+        parser.error(f"--dynamic-g only applies to improved GWO algorithms, not {args.algorithm}")
+    if args.algorithm == "mogwo" and (args.workers or args.islands or args.multires or args.backend != "numpy"):
+        parser.error("mogwo only supports in-process NumPy runs (no --workers/--islands/--multires/--backend)")
+    if args.restart_fraction is not None and args.restart_threshold is None:
+        parser.error("--restart-fraction needs --restart-threshold")
+    if args.islands and (args.workers or args.multires or args.save_images):
+        parser.error("--workers, --multires and --save-images cannot be combined with --islands")
+    if args.islands and args.stop_diversity is not None:
+        parser.error("--stop-diversity cannot be combined with --islands")
+    if args.checkpoint and (args.islands or args.multires):
+        parser.error("--checkpoint is only supported for single-population runs")
+
+
+def run(args, record_paths=False):
+    """Run one optimization as described by the command-line arguments."""
     UAV = UAV_SetUp()
-    seed = set_seed(None)  # Change to an integer for a fixed seed
-    # print(f"Using seed: {seed}")
-
-    is_normal = True
-    # Run optimization
-    solution = GWO(UAV, SearchAgents, Max_iter, seed, is_normal=is_normal)
-
-    # # Export data
-    # animation_filename = "normal_gwo.json" if is_normal else "imporve_gwo.json"
-    # export_animation_data(solution, UAV, filename=animation_filename)
-
-    # # Create and save animation
-    # animator = PathAnimator(UAV, ObjFun)
-    # animation, total_frames = animator.create_animation(solution["all_paths"])
-    # video_filename = "normal_gwo.mp4" if is_normal else "imporve_gwo.mp4"
-    # save_animation(animation, total_frames, filename=video_filename)
-
-    is_normal = False
-    # Run optimization
-    solution = GWO(UAV, SearchAgents, Max_iter, seed, is_normal=is_normal, dynamic_g=50)
-
-    # # Export data
-    # animation_filename = "normal_gwo.json" if is_normal else "imporve_gwo.json"
-    # export_animation_data(solution, UAV, filename=animation_filename)
-
-    # # Create and save animation
-    # animator = PathAnimator(UAV, ObjFun)
-    # animation, total_frames = animator.create_animation(solution["all_paths"])
-    # video_filename = "normal_gwo.mp4" if is_normal else "imporve_gwo.mp4"
-    # save_animation(animation, total_frames, filename=video_filename)
-
-    # print(f"Optimization completed and animation saved. Seed used: {seed}")
+    if args.points is not None:
+        UAV["PointNum"] = args.points
+    seed = set_seed(args.seed)
+
+    cls, kwargs = OPTIMIZERS[args.algorithm]
+    kwargs = {**kwargs, "record_paths": record_paths, "backend": args.backend}
+    if args.restart_threshold is not None:
+        kwargs["restart_threshold"] = args.restart_threshold
+        if args.restart_fraction is not None:
+            kwargs["restart_fraction"] = args.restart_fraction
+    if args.stop_diversity is not None:
+        kwargs["stop_diversity"] = args.stop_diversity
+    if args.float32:
+        kwargs["dtype"] = np.float32
+    if args.dynamic_g is not None:
+        kwargs["dynamic_g"] = args.dynamic_g
+
+    if args.save_images:
+        # Plotting stack is only imported when images are requested
+        from src.visualization.images import iteration_image_callback
+
+        kwargs["callback"] = iteration_image_callback(UAV, is_normal=kwargs.get("is_normal", True))
+
+    if args.islands:
+        from src.core.island import IslandGWO
+
+        island_kwargs = [
+            {k: v for k, v in kwargs.items() if k not in ("record_paths", "callback")}
+            for _ in range(args.islands)
+        ]
+        if issubclass(cls, GreyWolfOptimizer):
+            # Alternate the a schedule between islands
+            for i, island in enumerate(island_kwargs):
+                island["a_schedule"] = ("linear", "cosine")[i % 2]
+        solution = IslandGWO(
+            UAV, args.agents, args.iters, seed,
+            n_islands=args.islands,
+            island_kwargs=island_kwargs,
+            optimizer_cls=cls,
+            record_paths=record_paths,
+        )
+    elif args.multires:
+        from src.core.multires import MultiResolutionGWO
+
+        solution = MultiResolutionGWO(
+            UAV, args.agents, args.iters, seed,
+            optimizer_cls=cls, workers=args.workers, **kwargs
+        )
+    else:
+        optimizer = make_optimizer(
+            args.algorithm, UAV, args.agents, args.iters, seed,
+            workers=args.workers,
+            checkpoint=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            **kwargs
+        )
+        solution = optimizer.run()
+
+    if args.refine:
+        from src.core.refine import refine_solution
+
+        solution = refine_solution(solution, UAV)
+    return solution, UAV
+
+
+def cmd_plan(args):
+    solution, _ = run(args)
+    print(f"Seed used: {solution['seed']}")
+    print(f"Best fitness: {solution['Fitness_list'][-1]:.4f}")
+    if "Diversity_list" in solution:
+        print(f"Iterations: {len(solution['Fitness_list'])} | Final diversity: {solution['Diversity_list'][-1]:.4f}")
+    if "refined_fitness" in solution:
+        print(f"Refined fitness: {solution['refined_fitness']:.4f}")
+    if "pareto_front" in solution:
+        print(f"Pareto front ({', '.join(solution['objectives'])}): {len(solution['pareto_front'])} paths")
+        print(np.array2string(solution["pareto_front"], precision=2, suppress_small=True))
+    print("Best path:")
+    print(np.array2string(solution["best_path"], precision=2, suppress_small=True))
+
+
+def cmd_benchmark(args):
+    UAV = UAV_SetUp()
+    if args.points is not None:
+        UAV["PointNum"] = args.points
+    seeds = list(range(args.seed, args.seed + args.runs))
+    results = benchmark(UAV, args.algorithms or list(DEFAULT_BENCHMARK), args.agents, args.iters, seeds, workers=args.workers)
+    print_benchmark(results)
+
+
+def cmd_export(args):
+    from src.utils.export import export_animation_data
+
+    solution, UAV = run(args, record_paths=True)
+    export_animation_data(solution, UAV, filename=args.output)
+    print(f"Animation data exported to {args.output}. Seed used: {solution['seed']}")
+
+
+def cmd_render(args):
+    # Rendering is the only command that needs the plotting stack
+    from src.core.obj_fun import ObjFun
+    from src.visualization.animation import PathAnimator, save_animation
+    from src.visualization.utils import load_animation_data
+
+    data = load_animation_data(args.input)
+    animator = PathAnimator(data["UAV"], ObjFun)
+    if args.decimate:
+        animation, total_frames = animator.create_decimated_animation(
+            data["all_paths"], top_k=args.top_k, sample=args.sample
+        )
+    else:
+        animation, total_frames = animator.create_animation(data["all_paths"])
+    save_animation(animation, total_frames, filename=args.output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="GWO-based UAV global path planning")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan = subparsers.add_parser("plan", help="run an optimization and print the best path")
+    add_run_arguments(plan)
+    plan.set_defaults(func=cmd_plan)
+
+    bench = subparsers.add_parser("benchmark", help="compare optimizers on the same scenario")
+    bench.add_argument(
+        "-a", "--algorithms", nargs="+", choices=OPTIMIZERS, default=None,
+        help=f"default: {' '.join(DEFAULT_BENCHMARK)}"
+    )
+    bench.add_argument("-n", "--agents", type=int, default=200, help="SearchAgents")
+    bench.add_argument("-i", "--iters", type=int, default=100, help="Max_iter")
+    bench.add_argument("-s", "--seed", type=int, default=0, help="first seed")
+    bench.add_argument("-r", "--runs", type=int, default=5, help="seeds per algorithm")
+    bench.add_argument("--points", type=int, default=None, help="UAV PointNum")
+    bench.add_argument("--workers", type=int, default=None, help="fitness evaluation processes")
+    bench.set_defaults(func=cmd_benchmark)
+
+    export = subparsers.add_parser("export", help="run an optimization and export animation data")
+    add_run_arguments(export)
+    export.add_argument("-o", "--output", default="animation_export.json")
+    export.set_defaults(func=cmd_export)
+
+    render = subparsers.add_parser("render", help="render exported animation data to a video")
+    render.add_argument("input", help="JSON file written by the export command")
+    render.add_argument("-o", "--output", default="path_animation.mp4")
+    render.add_argument("--decimate", action="store_true", help="bounded rendering for large runs")
+    render.add_argument("--top-k", type=int, default=50, help="best wolves drawn with --decimate")
+    render.add_argument("--sample", type=int, default=150, help="random wolves drawn with --decimate")
+    render.set_defaults(func=cmd_render)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command in ("plan", "export"):
+        check_run_arguments(parser, args)
+    elif args.command == "benchmark" and args.workers and "mogwo" in (args.algorithms or ()):
+        parser.error("mogwo cannot be benchmarked with --workers")
+    args.func(args)
 
 
 if __name__ == "__main__":
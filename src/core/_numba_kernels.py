@@ -0,0 +1,52 @@
+import math
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def obj_fun_kernel(positions, start, goal, zones, safe_distance, w1, w2, out):
+    """Fused ObjFunBatch: one pass per agent, no (agents, points, zones) temporaries."""
+    agents, dim = positions.shape
+    points = dim // 3
+    for k in prange(agents):
+        total_distance = 0.0
+        collision_penalty = 0.0
+        px, py, pz = start[0], start[1], start[2]
+        # Path points: start, waypoints, goal
+        for j in range(points + 2):
+            if j == 0:
+                qx, qy, qz = start[0], start[1], start[2]
+            elif j == points + 1:
+                qx, qy, qz = goal[0], goal[1], goal[2]
+            else:
+                qx = positions[k, 3 * (j - 1)]
+                qy = positions[k, 3 * (j - 1) + 1]
+                qz = positions[k, 3 * (j - 1) + 2]
+
+            if j > 0:
+                total_distance += math.sqrt(
+                    (qx - px) ** 2 + (qy - py) ** 2 + (qz - pz) ** 2
+                )
+            px, py, pz = qx, qy, qz
+
+            for z in range(zones.shape[0]):
+                distance_xy = math.sqrt((qx - zones[z, 0]) ** 2 + (qy - zones[z, 1]) ** 2)
+                if distance_xy <= zones[z, 3] + safe_distance and 0 <= qz <= zones[z, 2]:
+                    collision_penalty += distance_xy
+
+        out[k] = w1 * total_distance + w2 * collision_penalty
+
+
+@njit(parallel=True, cache=True)
+def gwo_update_kernel(positions, leaders, A, C, two_a, a, two, weights):
+    """Fused GWO position update; A and C hold the uniform random draws."""
+    agents, dim = positions.shape
+    for i in prange(agents):
+        for j in range(dim):
+            x = positions[i, j]
+            new = x
+            for k in range(3):
+                D = abs(C[k, i, j] * two * leaders[k, j] - x)
+                X = (leaders[k, j] - (A[k, i, j] * two_a - a) * D) * weights[k]
+                new = X if k == 0 else new + X
+            positions[i, j] = new
@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+from .de import DifferentialEvolution
+from .gwo import GreyWolfOptimizer, HybridGWO
+from .mogwo import MultiObjectiveGWO
+from .pso import ParticleSwarmOptimizer
+
+# Registered optimizers: name -> (class, extra keyword arguments)
+OPTIMIZERS = {
+    "gwo": (GreyWolfOptimizer, {"is_normal": True}),
+    "igwo": (GreyWolfOptimizer, {"is_normal": False, "dynamic_g": 50}),
+    "hybrid": (HybridGWO, {"is_normal": False, "dynamic_g": 50}),
+    "pso": (ParticleSwarmOptimizer, {}),
+    "de": (DifferentialEvolution, {}),
+    "mogwo": (MultiObjectiveGWO, {}),
+}
+# Compared when no algorithm is given; mogwo does not support worker pools
+DEFAULT_BENCHMARK = ("gwo", "igwo", "hybrid", "pso", "de")
+
+
+def make_optimizer(name, UAV, SearchAgents, Max_iter, seed=None, **kwargs):
+    """Create a registered optimizer by name."""
+    if name not in OPTIMIZERS:
+        raise ValueError(f"Unknown optimizer: {name}")
+    cls, defaults = OPTIMIZERS[name]
+    return cls(UAV, SearchAgents, Max_iter, seed, **{**defaults, **kwargs})
+
+
+def benchmark(UAV, names, SearchAgents, Max_iter, seeds, **kwargs):
+    """Run every optimizer on the same scenario and seeds, head to head."""
+    results = {}
+    for name in names:
+        scores, evaluations, elapsed = [], [], []
+        for seed in seeds:
+            optimizer = make_optimizer(
+                name, UAV, SearchAgents, Max_iter, seed,
+                record_paths=False, verbose=False, **kwargs
+            )
+            start_time = time.time()
+            solution = optimizer.run()
+            elapsed.append(time.time() - start_time)
+            scores.append(solution["Fitness_list"][-1])
+            evaluations.append(solution["evaluations"])
+
+        results[name] = {
+            "best": float(np.min(scores)),
+            "mean": float(np.mean(scores)),
+            "std": float(np.std(scores)),
+            "evaluations": float(np.mean(evaluations)),
+            "time": float(np.mean(elapsed)),
+        }
+    return results
+
+
+def print_benchmark(results):
+    print(f"{'algorithm':<10}{'best':>12}{'mean':>12}{'std':>12}{'evals':>10}{'time(s)':>10}")
+    for name, r in results.items():
+        print(
+            f"{name:<10}{r['best']:>12.4f}{r['mean']:>12.4f}{r['std']:>12.4f}"
+            f"{r['evaluations']:>10.0f}{r['time']:>10.2f}"
+        )
@@ -0,0 +1,53 @@
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+class DifferentialEvolution(Optimizer):
+    """Differential Evolution (DE/rand/1/bin).
+
+    ``Positions`` holds the trial vectors of the current generation, the
+    surviving parents are kept in ``Parents``.
+    """
+
+    name = "DE"
+    state_keys = Optimizer.state_keys + ("Parents", "Parent_score")
+
+    def __init__(self, UAV, SearchAgents, Max_iter, seed=None, F=0.5, CR=0.9, **kwargs):
+        if SearchAgents < 4:
+            raise ValueError("DE needs at least 4 search agents!")
+        super().__init__(UAV, SearchAgents, Max_iter, seed, **kwargs)
+        self.F = F  # differential weight
+        self.CR = CR  # crossover probability
+
+    def initialize(self):
+        super().initialize()
+        self.Parents = np.copy(self.Positions)
+        self.Parent_score = np.full(len(self.Positions), np.inf)
+
+    def observe(self, Positions, fitness):
+        # Greedy selection between parents and trials
+        improved = fitness <= self.Parent_score
+        self.Parent_score[improved] = fitness[improved]
+        self.Parents[improved] = Positions[improved]
+
+    def update(self, iter):
+        n = len(self.Parents)
+
+        # Three mutually distinct donors per agent, all different from the agent
+        o1 = self.rng.integers(1, n, size=n)
+        o2 = self.rng.integers(1, n - 1, size=n)
+        o2 += o2 >= o1
+        o3 = self.rng.integers(1, n - 2, size=n)
+        o3 += o3 >= np.minimum(o1, o2)
+        o3 += o3 >= np.maximum(o1, o2)
+        i = np.arange(n)
+        r1, r2, r3 = (i + o1) % n, (i + o2) % n, (i + o3) % n
+
+        mutants = self.Parents[r1] + self.F * (self.Parents[r2] - self.Parents[r3])
+
+        # Binomial crossover, at least one dimension comes from the mutant
+        cross = self.rng.random(self.Parents.shape) < self.CR
+        cross[i, self.rng.integers(self.dim, size=n)] = True
+        # In place: Positions may be a view on the shared evaluation buffer
+        self.Positions[...] = np.where(cross, mutants, self.Parents)
@@ -0,0 +1,199 @@
+import multiprocessing as mp
+import queue as queue_module
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .gwo import GreyWolfOptimizer
+
+
+def _island_worker(index, n_islands, cls, UAV, SearchAgents, Max_iter, seed, kwargs,
+                   migration_interval, n_migrants, shm_name, barrier, queue):
+    """Run one island and exchange its best wolves with the ring neighbour."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    board = None
+    try:
+        optimizer = cls(UAV, SearchAgents, Max_iter, seed, verbose=False, **kwargs)
+        dim = optimizer.dim
+        # Double-buffered migration slots: (2, islands, migrants, dim + 1),
+        # the last column holds the score of each migrant.
+        board = np.ndarray(
+            (2, n_islands, n_migrants, dim + 1), dtype=np.float64, buffer=shm.buf
+        )
+        source = (index - 1) % n_islands
+
+        optimizer.reset()
+        start_time = time.time()
+        for iter in range(Max_iter):
+            optimizer.evaluate_step(iter)
+            migrate = (iter + 1) % migration_interval == 0 and iter + 1 < Max_iter
+            slot = (iter + 1) // migration_interval % 2
+            if migrate:
+                positions, scores = optimizer.emigrants(n_migrants)
+                board[slot, index, : len(scores), :dim] = positions
+                board[slot, index, : len(scores), dim] = scores
+
+            optimizer.update_step(iter)
+
+            if migrate:
+                barrier.wait()
+                incoming = board[slot, source]
+                optimizer.immigrate(incoming[np.isfinite(incoming[:, dim]), :dim])
+        optimizer.elapsed = time.time() - start_time
+
+        solution = optimizer.solution()
+        solution["best_score"] = optimizer.best_score
+        queue.put((index, solution, None))
+    except Exception:
+        barrier.abort()
+        queue.put((index, None, traceback.format_exc()))
+    finally:
+        del board
+        shm.close()
+
+
+def _collect_results(processes, queue, barrier, poll_interval):
+    """Wait for one result per island, failing if an island dies silently."""
+    results = {}
+    while len(results) < len(processes):
+        try:
+            index, solution, error = queue.get(timeout=poll_interval)
+            results[index] = (index, solution, error)
+            continue
+        except queue_module.Empty:
+            pass
+
+        dead = [i for i, process in enumerate(processes)
+                if i not in results and process.exitcode is not None]
+        if not dead:
+            continue
+        # A finished island flushes its result before exiting: drain the queue
+        # once more before declaring it dead
+        try:
+            while True:
+                index, solution, error = queue.get(timeout=0.1)
+                results[index] = (index, solution, error)
+        except queue_module.Empty:
+            pass
+        dead = [i for i in dead if i not in results]
+        if dead:
+            # Release the islands waiting at the migration barrier
+            barrier.abort()
+            raise RuntimeError(
+                f"Island worker {dead[0]} exited with code "
+                f"{processes[dead[0]].exitcode} without a result!"
+            )
+    return list(results.values())
+
+
+def IslandGWO(
+    UAV,
+    SearchAgents,
+    Max_iter,
+    seed,
+    n_islands=4,
+    migration_interval=10,
+    n_migrants=3,
+    island_kwargs=None,
+    optimizer_cls=GreyWolfOptimizer,
+    record_paths=False,
+    verbose=True,
+    poll_interval=1.0,
+):
+    """Island-model GWO: ``n_islands`` packs run in parallel processes.
+
+    Every ``migration_interval`` iterations each island sends its best
+    ``n_migrants`` wolves to the next island of a ring through shared memory,
+    where they replace the worst wolves. ``SearchAgents`` is the size of one
+    island. ``island_kwargs`` is a list with the extra optimizer arguments of
+    every island (e.g. ``a_schedule`` or ``dynamic_g``); by default islands
+    alternate between the linear and the cosine ``a`` schedule.
+
+    The parent polls the result queue every ``poll_interval`` seconds and
+    fails when an island process died without reporting (e.g. OOM-killed).
+    """
+    if island_kwargs is None:
+        island_kwargs = [
+            {"a_schedule": ("linear", "cosine")[i % 2]} for i in range(n_islands)
+        ]
+    if len(island_kwargs) != n_islands:
+        raise ValueError("island_kwargs needs one entry per island!")
+    if any(kwargs.get("stop") is not None or kwargs.get("stop_diversity") is not None
+           for kwargs in island_kwargs):
+        # A stopped island would leave the others waiting at the migration barrier
+        raise ValueError("Islands run for Max_iter iterations, stop/stop_diversity are not supported!")
+
+    # Independent seeds for every island derived from the run seed
+    seeds = np.random.SeedSequence(seed).generate_state(n_islands).tolist()
+    dim = UAV["PointNum"] * UAV["PointDim"]
+
+    ctx = mp.get_context()
+    shm = shared_memory.SharedMemory(
+        create=True, size=2 * n_islands * n_migrants * (dim + 1) * 8
+    )
+    board = np.ndarray(
+        (2, n_islands, n_migrants, dim + 1), dtype=np.float64, buffer=shm.buf
+    )
+    board[...] = np.inf
+    barrier = ctx.Barrier(n_islands)
+    queue = ctx.Queue()
+
+    if verbose:
+        print(f">>Island GWO: {n_islands} islands x {SearchAgents} wolves in progress...")
+    start_time = time.time()
+    processes = [
+        ctx.Process(
+            target=_island_worker,
+            args=(
+                i, n_islands, optimizer_cls, UAV, SearchAgents, Max_iter, seeds[i],
+                {**island_kwargs[i], "record_paths": record_paths},
+                migration_interval, n_migrants, shm.name, barrier, queue,
+            ),
+        )
+        for i in range(n_islands)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        results = _collect_results(processes, queue, barrier, poll_interval)
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        del board
+        shm.close()
+        shm.unlink()
+
+    errors = [error for _, _, error in results if error is not None]
+    if errors:
+        raise RuntimeError("Island worker failed:\n" + errors[0])
+
+    solutions = [solution for _, solution in sorted((i, s) for i, s, _ in results)]
+    best = min(solutions, key=lambda s: s["best_score"])
+
+    if verbose:
+        print(">>Calculation complete!")
+        print(f"Elapsed time: {time.time() - start_time:.2f} seconds")
+
+    all_paths = []
+    if record_paths:
+        # Concatenate the packs of all islands iteration by iteration
+        all_paths = [np.concatenate(paths) for paths in zip(*(s["all_paths"] for s in solutions))]
+
+    return {
+        "best_path": best["best_path"],
+        "Fitness_list": np.min([s["Fitness_list"] for s in solutions], axis=0),
+        "all_paths": all_paths,
+        "seed": seed,
+        "algorithm": "Island GWO",
+        "evaluations": sum(s["evaluations"] for s in solutions),
+        "islands": [
+            {"seed": s["seed"], "best_score": s["best_score"], "Fitness_list": s["Fitness_list"]}
+            for s in solutions
+        ],
+    }
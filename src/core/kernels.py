@@ -0,0 +1,61 @@
+import importlib.util
+import warnings
+
+import numpy as np
+
+from .obj_fun import ObjFunBatch, SAFE_DISTANCE, W1, W2
+
+BACKENDS = ("numpy", "numba", "auto")
+
+
+def numba_available():
+    return importlib.util.find_spec("numba") is not None
+
+
+def resolve_backend(backend):
+    """Map "numpy" / "numba" / "auto" to the backend that can actually run."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "auto":
+        return "numba" if numba_available() else "numpy"
+    if backend == "numba" and not numba_available():
+        warnings.warn("numba is not installed, falling back to the NumPy backend")
+        return "numpy"
+    return backend
+
+
+def ObjFunNumba(positions, UAV):
+    """Compiled ObjFunBatch (same results, multi-core, allocation-free)."""
+    # numba is only imported when this backend is used
+    from ._numba_kernels import obj_fun_kernel
+
+    if UAV["PointDim"] != 3:
+        raise ValueError("The numba backend needs 3D waypoints!")
+    positions = np.ascontiguousarray(positions)
+    dtype = np.result_type(positions.dtype, np.float32)
+    fitness = np.empty(len(positions))
+    obj_fun_kernel(
+        positions.astype(dtype, copy=False),
+        np.asarray(UAV["S"], dtype=dtype),
+        np.asarray(UAV["G"], dtype=dtype),
+        np.ascontiguousarray(UAV["NoFlyZones"], dtype=dtype),
+        dtype.type(SAFE_DISTANCE),
+        W1,
+        W2,
+        fitness,
+    )
+    return fitness
+
+
+def get_obj_fun(backend):
+    return ObjFunNumba if resolve_backend(backend) == "numba" else ObjFunBatch
+
+
+def gwo_update(Positions, leaders, A, C, a, weights):
+    """Compiled GWO position update, written into ``Positions`` in place."""
+    from ._numba_kernels import gwo_update_kernel
+
+    dtype = Positions.dtype.type
+    gwo_update_kernel(
+        Positions, leaders, A, C, dtype(2 * a), dtype(a), dtype(2), weights.astype(Positions.dtype)
+    )
@@ -0,0 +1,131 @@
+import numpy as np
+
+from .gwo import GreyWolfOptimizer
+from .obj_fun import OBJECTIVES, ObjFunComponents, W1, W2
+from .pareto import ParetoArchive
+
+
+def default_weights(count=5, max_altitude_weight=0.5):
+    """ObjFun weights plus an increasing weight on the altitude objective."""
+    return np.column_stack(
+        (np.full(count, W1), np.full(count, W2), np.linspace(0, max_altitude_weight, count))
+    )
+
+
+class MultiObjectiveGWO(GreyWolfOptimizer):
+    """Multi-objective GWO: one run yields the whole trade-off front.
+
+    The pack is split into one group per row of ``weights`` (weightings of
+    OBJECTIVES). Each group follows the three best positions ever evaluated
+    under its own weighting, so every evaluation serves all the groups, and
+    every evaluated wolf is offered to a bounded Pareto archive. The first
+    row scores ``best_path`` and the progress report (with the default
+    weights it is ObjFun itself). ``is_normal`` picks the initialization and
+    the ``a`` schedule; the leaders are always averaged with equal weights.
+    """
+
+    state_keys = GreyWolfOptimizer.state_keys + (
+        "group_leaders", "group_scores", "archive_positions", "archive_objectives"
+    )
+
+    def __init__(
+        self,
+        UAV,
+        SearchAgents,
+        Max_iter,
+        seed=None,
+        archive_size=100,
+        weights=None,
+        primary_share=0.5,
+        **kwargs,
+    ):
+        if kwargs.get("workers"):
+            raise ValueError("MultiObjectiveGWO evaluates in-process, workers are not supported!")
+        if "dynamic_g" in kwargs:
+            raise ValueError("MultiObjectiveGWO always averages its leaders, dynamic_g is not supported!")
+        if kwargs.get("backend", "numpy") != "numpy":
+            raise ValueError("MultiObjectiveGWO only runs on the NumPy backend!")
+        super().__init__(UAV, SearchAgents, Max_iter, seed, **kwargs)
+        self.weights_matrix = np.atleast_2d(default_weights() if weights is None else weights)
+        if self.weights_matrix.shape[1] != len(OBJECTIVES):
+            raise ValueError(f"weights needs one column per objective {OBJECTIVES}!")
+        self.primary_share = primary_share
+
+        # Weighting followed by every wolf: primary_share of the pack on the
+        # first row, the other rows share the rest
+        groups = len(self.weights_matrix)
+        primary = SearchAgents if groups == 1 else int(primary_share * SearchAgents)
+        self.group = np.concatenate(
+            (np.zeros(primary, dtype=int), 1 + np.arange(SearchAgents - primary) % max(groups - 1, 1))
+        )
+        self.archive = ParetoArchive(archive_size, self.dim, len(OBJECTIVES), self.dtype)
+        self.obj_fun = self.scalarized_objective
+        self.name = "MOGWO"
+
+    @property
+    def archive_positions(self):
+        return self.archive.positions
+
+    @archive_positions.setter
+    def archive_positions(self, value):
+        self.archive.positions = value
+
+    @property
+    def archive_objectives(self):
+        return self.archive.objectives
+
+    @archive_objectives.setter
+    def archive_objectives(self, value):
+        self.archive.objectives = value
+
+    def initialize(self):
+        super().initialize()
+        groups = len(self.weights_matrix)
+        self.group_leaders = np.zeros((groups, 3, self.dim), dtype=self.dtype)
+        self.group_scores = np.full((groups, 3), np.inf)
+        self.archive = ParetoArchive(
+            self.archive.capacity, self.dim, len(OBJECTIVES), self.dtype
+        )
+
+    def scalarized_objective(self, positions, UAV):
+        self.last_objectives = ObjFunComponents(positions, UAV)
+        self.archive.update(positions, self.last_objectives)
+        return self.last_objectives @ self.weights_matrix[0]
+
+    def observe(self, Positions, fitness):
+        # Best three of the current leaders and the new wolves, per weighting
+        scores = np.concatenate((self.group_scores, self.weights_matrix @ self.last_objectives.T), axis=1)
+        best = np.argsort(scores, axis=1, kind="stable")[:, :3]
+        # Only the (groups, 3) winners are gathered: index < 3 is a current leader
+        from_pack = (best >= 3)[:, :, None]
+        self.group_leaders = np.where(
+            from_pack,
+            Positions[np.maximum(best - 3, 0)],
+            np.take_along_axis(self.group_leaders, np.minimum(best, 2)[:, :, None], axis=1),
+        )
+        self.group_scores = np.take_along_axis(scores, best, axis=1)
+
+        # Alpha, Beta and Delta are the leaders of the first weighting
+        self.leaders[:] = self.group_leaders[0]
+        self.Alpha_score, self.Beta_score, self.Delta_score = self.group_scores[0]
+
+    def update(self, iter):
+        a = self.coefficient(iter)
+        shape = (3,) + self.Positions.shape
+        leaders = self.group_leaders[self.group].transpose(1, 0, 2)
+
+        r1 = self.rng.random(shape, dtype=self.dtype)
+        r2 = self.rng.random(shape, dtype=self.dtype)
+        A, C = 2 * a * r1 - a, 2 * r2
+        D = np.abs(C * leaders - self.Positions)
+        np.mean(leaders - A * D, axis=0, out=self.Positions)
+
+    def solution(self):
+        solution = super().solution()
+        order = np.argsort(self.archive.objectives[:, 0])
+        solution["objectives"] = OBJECTIVES
+        solution["pareto_front"] = self.archive.objectives[order]
+        solution["pareto_paths"] = self.archive.positions[order].reshape(
+            len(order), self.UAV["PointNum"], self.UAV["PointDim"]
+        )
+        return solution
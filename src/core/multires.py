@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+
+from .gwo import GreyWolfOptimizer
+from .kernels import get_obj_fun
+
+
+def upsample_positions(Positions, UAV, PointNum):
+    """Resample every path to ``PointNum`` waypoints, keeping its vertices.
+
+    The ``PointNum - current`` new waypoints are spread as evenly as possible
+    over the segments of the polyline start -> waypoints -> goal and placed
+    uniformly along their segment, so the upsampled path has exactly the
+    same shape (and length) as the coarse one.
+    """
+    Positions = np.asarray(Positions, dtype=float)
+    waypoints = Positions.reshape(len(Positions), -1, UAV["PointDim"])
+    agents, current = waypoints.shape[:2]
+    if PointNum < current:
+        raise ValueError("upsample_positions cannot remove waypoints!")
+    paths = np.concatenate(
+        (
+            np.broadcast_to(UAV["S"], (agents, 1, UAV["PointDim"])),
+            waypoints,
+            np.broadcast_to(UAV["G"], (agents, 1, UAV["PointDim"])),
+        ),
+        axis=1,
+    )
+
+    # New points per segment, then their position in the index space of the
+    # polyline (integers are the original vertices)
+    segments = current + 1
+    extra = np.diff(np.arange(segments + 1) * (PointNum - current) // segments)
+    t = np.concatenate(
+        [k + np.arange(m + 1) / (m + 1) for k, m in enumerate(extra)]
+    )[1:]
+    i0 = np.minimum(np.floor(t).astype(int), current)
+    frac = (t - i0)[None, :, None]
+    resampled = paths[:, i0] * (1 - frac) + paths[:, i0 + 1] * frac
+    return resampled.reshape(agents, -1)
+
+
+class UpsampledObjective:
+    """Score coarse paths with ``obj_fun`` on their upsampled fine version.
+
+    The collision penalty only looks at waypoints, so a coarse segment could
+    cut through a no-fly zone unnoticed and the waypoints inserted by the
+    next stage would land inside it. Scoring the path that the final stage
+    will actually see keeps the coarse fitness equal to the fine one.
+    """
+
+    def __init__(self, obj_fun, UAV):
+        self.obj_fun = obj_fun
+        self.UAV = UAV  # UAV of the final stage
+
+    def __call__(self, positions, UAV):
+        fine = upsample_positions(positions, UAV, self.UAV["PointNum"])
+        return self.obj_fun(fine, self.UAV)
+
+
+def default_point_schedule(PointNum, levels=3):
+    """Waypoint counts doubling up to ``PointNum``, e.g. 10 -> [3, 5, 10]."""
+    schedule = [PointNum]
+    for _ in range(levels - 1):
+        coarse = math.ceil(schedule[0] / 2)
+        if coarse >= schedule[0] or coarse < 2:
+            break
+        schedule.insert(0, coarse)
+    return schedule
+
+
+def MultiResolutionGWO(
+    UAV,
+    SearchAgents,
+    Max_iter,
+    seed,
+    point_schedule=None,
+    iter_schedule=None,
+    optimizer_cls=GreyWolfOptimizer,
+    **kwargs,
+):
+    """Coarse-to-fine optimization over an increasing number of waypoints.
+
+    Each stage optimizes paths with ``point_schedule[k]`` waypoints for
+    ``iter_schedule[k]`` iterations; its final population (and best path) is
+    upsampled to seed the next stage, until ``UAV["PointNum"]`` is reached.
+    Coarse stages are scored on their upsampled paths (UpsampledObjective),
+    so a coarse evaluation costs as much as a fine one: the saving comes
+    from the smaller search space, which needs far fewer evaluations, not
+    from cheaper evaluations. Recorded paths of every stage are upsampled to
+    ``UAV["PointNum"]`` so that ``all_paths`` lines up with ``Fitness_list``.
+    """
+    if point_schedule is None:
+        point_schedule = default_point_schedule(UAV["PointNum"])
+    if point_schedule[-1] != UAV["PointNum"]:
+        raise ValueError("point_schedule must end with UAV['PointNum']!")
+    if iter_schedule is None:
+        iter_schedule = [Max_iter // len(point_schedule)] * len(point_schedule)
+        iter_schedule[-1] += Max_iter - sum(iter_schedule)
+    if len(iter_schedule) != len(point_schedule):
+        raise ValueError("iter_schedule needs one entry per stage!")
+    if min(iter_schedule) < 1:
+        raise ValueError("Every stage needs at least one iteration, use a shorter point_schedule!")
+
+    obj_fun = kwargs.pop("obj_fun", None) or get_obj_fun(kwargs.get("backend", "numpy"))
+    seeds = np.random.SeedSequence(seed).generate_state(len(point_schedule)).tolist()
+
+    Positions = best_pos = None
+    Fitness_list = []
+    Diversity_list = []
+    all_paths = []
+    evaluations = 0
+    stages = []
+    for PointNum, iterations, stage_seed in zip(point_schedule, iter_schedule, seeds):
+        stage_UAV = {**UAV, "PointNum": PointNum}
+
+        initial_positions = None
+        if Positions is not None:
+            # Keep the best path of the previous stage as the first wolf
+            initial_positions = upsample_positions(
+                np.vstack((best_pos, Positions)), stage_UAV, PointNum
+            )
+
+        optimizer = optimizer_cls(
+            stage_UAV,
+            SearchAgents,
+            iterations,
+            stage_seed,
+            initial_positions=initial_positions,
+            obj_fun=obj_fun if PointNum == UAV["PointNum"] else UpsampledObjective(obj_fun, UAV),
+            **kwargs,
+        )
+        optimizer.name = f"{optimizer.name} ({PointNum} points)"
+        solution = optimizer.run()
+
+        Positions = optimizer.Positions
+        best_pos = optimizer.best_pos
+        Fitness_list.append(solution["Fitness_list"])
+        Diversity_list.append(solution["Diversity_list"])
+        for paths in solution["all_paths"]:
+            fine = upsample_positions(paths.reshape(len(paths), -1), stage_UAV, UAV["PointNum"])
+            all_paths.append(fine.reshape(len(paths), -1, UAV["PointDim"]).astype(paths.dtype))
+        evaluations += solution["evaluations"]
+        stages.append(
+            {"PointNum": PointNum, "Max_iter": iterations, "best_score": optimizer.best_score}
+        )
+
+    solution["Fitness_list"] = np.concatenate(Fitness_list)
+    solution["Diversity_list"] = np.concatenate(Diversity_list)
+    solution["all_paths"] = all_paths
+    solution["evaluations"] = evaluations
+    solution["seed"] = seed
+    solution["stages"] = stages
+    return solution
@@ -1,5 +1,11 @@
 import numpy as np
 
+# Objective weights: path length vs. distance inside no-fly zones
+W1 = 0.2
+W2 = 100
+# Safe distance kept around every no-fly zone
+SAFE_DISTANCE = 0.2
+
 
 def ObjFun(position, UAV):
     path = np.vstack((UAV["S"], position.reshape(-1, UAV["PointDim"]), UAV["G"]))
@@ -17,12 +23,68 @@ def ObjFun(position, UAV):
 
     # Objective function: heavily penalize collisions, but prioritize distance minimization
     # NOTE: not calculate the height penalty
-    w1 = 0.2
-    w2 = 100
-    fitness = w1 * total_distance + w2 * collision_penalty
+    fitness = W1 * total_distance + W2 * collision_penalty
     return fitness
 
 
+def ObjFunBatch(positions, UAV):
+    """Vectorized ObjFun: evaluate a whole (agents, dim) population at once."""
+    paths = build_paths(positions, UAV)
+
+    # Calculate total distance of every path
+    total_distance = np.linalg.norm(np.diff(paths, axis=1), axis=2).sum(axis=1)
+
+    collision_penalty = no_fly_zones_distance_batch(paths, UAV["NoFlyZones"])
+
+    return W1 * total_distance + W2 * collision_penalty
+
+
+# Objective components returned by ObjFunComponents, in column order
+OBJECTIVES = ("length", "collision", "altitude")
+
+
+def ObjFunComponents(positions, UAV):
+    """Unweighted objectives of a population: (agents, 3) array of OBJECTIVES.
+
+    length: total path length, collision: distance of the path points inside
+    the no-fly zones (as in ObjFun), altitude: mean deviation of the
+    waypoints from ``UAV["CruiseAltitude"]``.
+    """
+    paths = build_paths(positions, UAV)
+    total_distance = np.linalg.norm(np.diff(paths, axis=1), axis=2).sum(axis=1)
+    collision_penalty = no_fly_zones_distance_batch(paths, UAV["NoFlyZones"])
+    altitude = np.abs(paths[:, 1:-1, 2] - UAV["CruiseAltitude"]).mean(axis=1)
+    return np.stack((total_distance, collision_penalty, altitude), axis=1)
+
+
+def build_paths(positions, UAV):
+    """Stack start, waypoints and goal into an (agents, PointNum + 2, PointDim) array."""
+    positions = np.asarray(positions)
+    waypoints = positions.reshape(positions.shape[0], -1, UAV["PointDim"])
+    agents = waypoints.shape[0]
+    # Keep the dtype of the population (float32 paths stay float32)
+    dtype = np.result_type(waypoints.dtype, np.float32)
+    start = np.broadcast_to(np.asarray(UAV["S"], dtype=dtype), (agents, 1, UAV["PointDim"]))
+    goal = np.broadcast_to(np.asarray(UAV["G"], dtype=dtype), (agents, 1, UAV["PointDim"]))
+    return np.concatenate((start, waypoints, goal), axis=1)
+
+
+def no_fly_zones_distance_batch(paths, no_fly_zones):
+    """Vectorized calculate_no_fly_zones_distance over a batch of paths."""
+    zones = np.asarray(no_fly_zones, dtype=paths.dtype)
+    # XY distance of every path point to every zone center: (agents, points, zones)
+    distance_xy = np.linalg.norm(
+        paths[:, :, None, :2] - zones[None, None, :, :2], axis=3
+    )
+    z = paths[:, :, None, 2]
+    inside = (
+        (distance_xy <= zones[:, 3] + SAFE_DISTANCE)
+        & (z >= 0)
+        & (z <= zones[:, 2])
+    )
+    return np.where(inside, distance_xy, 0).sum(axis=(1, 2))
+
+
 def calculate_no_fly_zones_distance(path, no_fly_zones):
     # check collisions
     result = 0
@@ -36,7 +98,7 @@ def calculate_no_fly_zones_distance(path, no_fly_zones):
 
 
 def is_point_in_no_fly_zone(point, zone):
-    distance_threshold = 0.2  # setting safe distance with the no fly zone
+    distance_threshold = SAFE_DISTANCE  # setting safe distance with the no fly zone
     x, y, height, radius = zone
     center = np.array([x, y, 0])  # Cylinder base center
 
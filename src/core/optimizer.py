@@ -0,0 +1,333 @@
+import json
+import os
+import time
+
+import numpy as np
+
+from .kernels import get_obj_fun, resolve_backend
+from .parallel import SharedPopulationEvaluator
+
+
+def get_bounds(UAV):
+    """Return the (low, high) bounds of a flattened position vector."""
+    low = np.tile(
+        [UAV["limt"]["x"][0], UAV["limt"]["y"][0], UAV["limt"]["z"][0]],
+        UAV["PointNum"],
+    )
+    high = np.tile(
+        [UAV["limt"]["x"][1], UAV["limt"]["y"][1], UAV["limt"]["z"][1]],
+        UAV["PointNum"],
+    )
+    return low.astype(float), high.astype(float)
+
+
+def population_diversity(Positions, best_pos, lb, ub):
+    """Mean distance of the pack to the best wolf, relative to the search box diagonal."""
+    distance = np.linalg.norm(Positions - best_pos, axis=1).mean()
+    return float(distance / np.linalg.norm(ub - lb))
+
+
+class Optimizer:
+    """Population-based path optimizer.
+
+    Handles everything that is shared between metaheuristics: population
+    initialization, batched fitness evaluation, bounds handling, recording of
+    the visited paths and stopping. Algorithms plug in as update rules by
+    overriding ``update`` and, when they keep extra state, ``initialize`` and
+    ``observe``.
+
+    The diversity of the pack is tracked every iteration. Below
+    ``restart_threshold`` the worst ``restart_fraction`` of the wolves is
+    re-seeded uniformly, and below ``stop_diversity`` the run stops early.
+    """
+
+    name = "Optimizer"
+    # Attributes that make up the optimizer state saved in checkpoints
+    state_keys = (
+        "Positions", "fitness", "best_pos", "best_score", "evaluations",
+        "Fitness_list", "Diversity_list", "restarts",
+    )
+
+    def __init__(
+        self,
+        UAV,
+        SearchAgents,
+        Max_iter,
+        seed=None,
+        obj_fun=None,
+        record_paths=True,
+        verbose=True,
+        callback=None,
+        stop=None,
+        workers=None,
+        initial_positions=None,
+        checkpoint=None,
+        checkpoint_every=10,
+        dtype=np.float64,
+        backend="numpy",
+        restart_threshold=None,
+        restart_fraction=0.2,
+        stop_diversity=None,
+    ):
+        self.UAV = UAV
+        self.SearchAgents = SearchAgents
+        self.Max_iter = Max_iter
+        self.seed = seed
+        self.backend = resolve_backend(backend)  # "numpy" or compiled "numba" kernels
+        # batched objective: (agents, dim) -> (agents,), picked by the backend by default
+        self.obj_fun = obj_fun if obj_fun is not None else get_obj_fun(self.backend)
+        self.record_paths = record_paths
+        self.verbose = verbose
+        self.callback = callback  # called as callback(iter, Positions) after each update
+        self.stop = stop  # called as stop(optimizer, iter); True ends the run
+        self.workers = workers  # evaluate over a shared-memory worker pool when set
+        self.initial_positions = initial_positions  # seeds the first rows of the population
+        self.checkpoint = checkpoint  # checkpoint file, resumed from when it exists
+        self.checkpoint_every = checkpoint_every
+        self.dtype = np.dtype(dtype)  # np.float32 halves memory for very large packs
+        self.restart_threshold = restart_threshold
+        self.restart_fraction = restart_fraction
+        self.stop_diversity = stop_diversity
+
+        self.dim = UAV["PointNum"] * UAV["PointDim"]
+        self.lb, self.ub = (bound.astype(self.dtype) for bound in get_bounds(UAV))
+        self.rng = np.random.default_rng(seed)
+
+    # ------------------------------------------------------------------
+    # Hooks for the update rules
+    # ------------------------------------------------------------------
+    def initialize(self):
+        """Create the initial population (uniform inside the UAV limits)."""
+        self.Positions = self.rng.uniform(
+            self.lb, self.ub, size=(self.SearchAgents, self.dim)
+        ).astype(self.dtype, copy=False)
+
+    def observe(self, Positions, fitness):
+        """Receive the fitness of the population that was just evaluated."""
+
+    def update(self, iter):
+        """Move ``self.Positions`` for the next iteration."""
+        raise NotImplementedError
+
+    def should_stop(self, iter):
+        # The pack has collapsed: further iterations add almost nothing
+        if self.stop_diversity is not None and self.Diversity_list[iter] < self.stop_diversity:
+            return True
+        return self.stop is not None and bool(self.stop(self, iter))
+
+    # ------------------------------------------------------------------
+    # Shared pipeline
+    # ------------------------------------------------------------------
+    def evaluate(self, Positions):
+        """Evaluate a batch of positions and keep track of the best one seen."""
+        fitness = np.asarray(self.obj_fun(Positions, self.UAV), dtype=float)
+        self.evaluations += len(fitness)
+
+        best = np.argmin(fitness)
+        if fitness[best] < self.best_score:
+            self.best_score = fitness[best]
+            self.best_pos[:] = Positions[best]
+        return fitness
+
+    def enforce_bounds(self):
+        np.clip(self.Positions, self.lb, self.ub, out=self.Positions)
+
+    def reset(self):
+        """Prepare a fresh run: initial population and empty records."""
+        self.best_pos = np.zeros(self.dim, dtype=self.dtype)
+        self.best_score = np.inf
+        self.evaluations = 0
+        self.fitness = None
+        self.Fitness_list = np.zeros(self.Max_iter)
+        self.Diversity_list = np.zeros(self.Max_iter)
+        self.restarts = 0
+        self.all_paths = []
+        self._saved_frames = 0  # path frames already written to the checkpoint
+        self.initialize()
+        if self.initial_positions is not None:
+            seeds = np.asarray(self.initial_positions, dtype=float)[: len(self.Positions)]
+            self.Positions[: len(seeds)] = seeds
+
+    def evaluate_step(self, iter):
+        """Record and evaluate the current population; False means stop."""
+        # Store current paths
+        if self.record_paths:
+            self.all_paths.append(
+                self.Positions.reshape(
+                    len(self.Positions), -1, self.UAV["PointDim"]
+                ).copy()
+            )
+
+        self.fitness = self.evaluate(self.Positions)
+        self.observe(self.Positions, self.fitness)
+
+        # Store best fitness and diversity
+        self.Fitness_list[iter] = self.best_score
+        self.Diversity_list[iter] = population_diversity(
+            self.Positions, self.best_pos, self.lb, self.ub
+        )
+
+        # Print progress
+        progress = (iter + 1) / self.Max_iter * 100
+        self._print(
+            f"\r>>{self.name} Optimization in progress    {progress:.2f}% | Best fitness: {self.best_score:.4f}"
+        )
+
+        if self.should_stop(iter):
+            self.Fitness_list = self.Fitness_list[: iter + 1]
+            self.Diversity_list = self.Diversity_list[: iter + 1]
+            return False
+        return True
+
+    def update_step(self, iter):
+        """Move the population and bring it back inside the bounds."""
+        self.update(iter)
+        self.enforce_bounds()
+
+        if self.restart_threshold is not None and self.Diversity_list[iter] < self.restart_threshold:
+            self.restart()
+
+        if self.callback is not None:
+            self.callback(iter, self.Positions)
+
+    def restart(self):
+        """Re-seed the worst ``restart_fraction`` of the last evaluated wolves."""
+        count = int(np.ceil(self.restart_fraction * len(self.Positions)))
+        worst = np.argsort(self.fitness)[::-1][:count]
+        self.Positions[worst] = self.rng.uniform(self.lb, self.ub, size=(count, self.dim))
+        self.restarts += 1
+
+    def emigrants(self, count):
+        """Best ``count`` (positions, scores) of the last evaluated population."""
+        order = np.argsort(self.fitness)[:count]
+        return self.Positions[order].copy(), self.fitness[order].copy()
+
+    def immigrate(self, positions):
+        """Replace the worst wolves of the last evaluation with ``positions``."""
+        worst = np.argsort(self.fitness)[::-1][: len(positions)]
+        self.Positions[worst] = positions
+
+    def checkpoint_meta(self):
+        """Run settings a checkpoint must match to be resumed."""
+        return {
+            "algorithm": type(self).__name__,
+            "seed": None if self.seed is None else int(self.seed),
+            "SearchAgents": self.SearchAgents,
+            "Max_iter": self.Max_iter,
+            "dim": self.dim,
+            "dtype": self.dtype.name,
+            "record_paths": self.record_paths,
+        }
+
+    def save_checkpoint(self, filename, next_iter):
+        """Write the full optimizer state (including the RNG) to ``filename``.
+
+        Recorded paths go to ``<filename>.paths``; only the frames recorded
+        since the previous save are appended to it.
+        """
+        state = {key: getattr(self, key) for key in self.state_keys}
+        if self.record_paths:
+            frame = self.Positions.nbytes
+            with open(f"{filename}.paths", "r+b" if self._saved_frames else "wb") as file:
+                # Drop frames appended by a save that was interrupted
+                file.truncate(self._saved_frames * frame)
+                file.seek(0, os.SEEK_END)
+                for paths in self.all_paths[self._saved_frames :]:
+                    file.write(paths.tobytes())
+            self._saved_frames = len(self.all_paths)
+            state["path_frames"] = self._saved_frames
+        state["next_iter"] = next_iter
+        state["meta"] = json.dumps(self.checkpoint_meta())
+        state["rng_state"] = json.dumps(self.rng.bit_generator.state)
+
+        # Write to a temporary file first so a preempted save never corrupts it
+        tmp_filename = f"{filename}.tmp.npz"
+        np.savez_compressed(tmp_filename, **state)
+        os.replace(tmp_filename, filename)
+
+    def load_checkpoint(self, filename):
+        """Restore a state written by ``save_checkpoint``; returns the next iteration."""
+        with np.load(filename) as data:
+            state = {key: data[key][()] if data[key].ndim == 0 else data[key] for key in data.files}
+
+        meta = json.loads(str(state["meta"]))
+        expected = self.checkpoint_meta()
+        mismatch = [key for key in expected if meta.get(key) != expected[key]]
+        if mismatch:
+            details = ", ".join(f"{key}={meta.get(key)!r} (now {expected[key]!r})" for key in mismatch)
+            raise ValueError(f"Checkpoint {filename} belongs to another run: {details}")
+
+        for key in self.state_keys:
+            setattr(self, key, state[key])
+        self._saved_frames = int(state.get("path_frames", 0))
+        self.all_paths = []
+        if self._saved_frames:
+            frames = np.fromfile(
+                f"{filename}.paths", dtype=self.dtype, count=self._saved_frames * self.Positions.size
+            )
+            self.all_paths = list(
+                frames.reshape(self._saved_frames, len(self.Positions), -1, self.UAV["PointDim"])
+            )
+        self.rng.bit_generator.state = json.loads(str(state["rng_state"]))
+        return int(state["next_iter"])
+
+    def run(self):
+        start_iter = 0
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            start_iter = self.load_checkpoint(self.checkpoint)
+        else:
+            self.reset()
+
+        obj_fun = self.obj_fun
+        if self.workers:
+            self.obj_fun = SharedPopulationEvaluator(
+                self.UAV, self.SearchAgents, obj_fun, self.workers, dtype=self.dtype
+            )
+            # The population lives in the shared buffer, evaluations copy nothing
+            shared = self.obj_fun.positions[: len(self.Positions)]
+            shared[...] = self.Positions
+            self.Positions = shared
+            self.obj_fun.holds_population = True
+
+        start_time = time.time()
+        self._print(f">>{self.name} Optimization in progress    00.00%")
+        try:
+            for iter in range(start_iter, self.Max_iter):
+                if not self.evaluate_step(iter):
+                    break
+                self.update_step(iter)
+
+                if self.checkpoint is not None and (iter + 1) % self.checkpoint_every == 0:
+                    self.save_checkpoint(self.checkpoint, iter + 1)
+        finally:
+            if self.obj_fun is not obj_fun:
+                # Detach the population before the shared buffer is released
+                self.Positions = np.array(self.Positions)
+                self.obj_fun.close()
+                self.obj_fun = obj_fun
+
+        end_time = time.time()
+        self.elapsed = end_time - start_time
+        if self.verbose:
+            print("\n\n>>Calculation complete!")
+            print(f"Elapsed time: {self.elapsed:.2f} seconds")
+
+        return self.solution()
+
+    def solution(self):
+        return {
+            "best_path": self.best_pos.reshape(
+                self.UAV["PointNum"], self.UAV["PointDim"]
+            ),
+            "Fitness_list": self.Fitness_list,
+            "Diversity_list": self.Diversity_list,
+            "restarts": self.restarts,
+            "all_paths": self.all_paths,
+            "seed": self.seed,  # Include the seed in the solution for reference
+            "algorithm": self.name,
+            "evaluations": self.evaluations,
+        }
+
+    def _print(self, text):
+        if self.verbose:
+            print(text, end="", flush=True)
@@ -0,0 +1,122 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .obj_fun import ObjFunBatch
+
+# Per-process state of the evaluation workers, filled once by _init_worker
+_worker = {}
+
+
+def _init_worker(obj_fun, UAV, positions_spec, fitness_spec, zones_spec):
+    """Attach the shared buffers and build the worker's UAV once."""
+    buffers = {}
+    for key, (name, shape, dtype) in (
+        ("positions", positions_spec),
+        ("fitness", fitness_spec),
+        ("zones", zones_spec),
+    ):
+        shm = shared_memory.SharedMemory(name=name)
+        buffers[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _worker[key + "_shm"] = shm
+
+    # The obstacles stay in shared memory and are reused by every evaluation
+    _worker["UAV"] = {**UAV, "NoFlyZones": buffers["zones"]}
+    _worker["obj_fun"] = obj_fun
+    _worker.update(buffers)
+
+
+def _evaluate_range(bounds):
+    start, stop = bounds
+    _worker["fitness"][start:stop] = _worker["obj_fun"](
+        _worker["positions"][start:stop], _worker["UAV"]
+    )
+
+
+class SharedPopulationEvaluator:
+    """Batched objective evaluated by a persistent pool of worker processes.
+
+    The population, the fitness vector and the no-fly zones live in
+    ``multiprocessing.shared_memory``; each call only sends index ranges to the
+    workers. Instances are drop-in replacements for ``ObjFunBatch``; a
+    population allocated as a view on ``positions`` (in ``dtype``) is
+    evaluated without any copy. Set ``holds_population`` in that case so
+    that other batches restore the rows they borrow.
+    """
+
+    def __init__(self, UAV, SearchAgents, obj_fun=ObjFunBatch, processes=None, dtype=np.float64):
+        self.capacity = SearchAgents
+        self.holds_population = False
+        self.processes = processes or mp.cpu_count()
+        dim = UAV["PointNum"] * UAV["PointDim"]
+        zones = np.asarray(UAV["NoFlyZones"], dtype=np.float64)
+
+        self._shms = []
+        self.positions = self._shared((SearchAgents, dim), dtype)
+        self.fitness = self._shared((SearchAgents,))
+        self.zones = self._shared(zones.shape)
+        self.zones[...] = zones
+
+        specs = [(shm.name, array.shape, array.dtype) for shm, array in zip(
+            self._shms, (self.positions, self.fitness, self.zones)
+        )]
+        worker_UAV = {key: value for key, value in UAV.items() if key != "NoFlyZones"}
+        self.pool = mp.get_context().Pool(
+            self.processes,
+            initializer=_init_worker,
+            initargs=(obj_fun, worker_UAV, *specs),
+        )
+
+    def _shared(self, shape, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1)
+        )
+        self._shms.append(shm)
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    def _is_shared(self, chunk):
+        """True when ``chunk`` already is the head of the shared buffer."""
+        return (
+            chunk.dtype == self.positions.dtype
+            and chunk.strides == self.positions.strides
+            and chunk.ctypes.data == self.positions.ctypes.data
+        )
+
+    def __call__(self, positions, UAV=None):
+        positions = np.asarray(positions)
+        fitness = np.empty(len(positions))
+        # Batches larger than the shared buffer are evaluated chunk by chunk
+        for offset in range(0, len(positions), self.capacity):
+            chunk = positions[offset : offset + self.capacity]
+            n = len(chunk)
+            shared = self._is_shared(chunk)
+            borrowed = not shared and self.holds_population
+            if borrowed:
+                # The buffer holds the optimizer's population: restore it afterwards
+                saved = self.positions[:n].copy()
+            if not shared:
+                self.positions[:n] = chunk
+
+            edges = np.linspace(0, n, min(self.processes, n) + 1).astype(int)
+            self.pool.map(_evaluate_range, list(zip(edges[:-1], edges[1:])))
+            fitness[offset : offset + n] = self.fitness[:n]
+            if borrowed:
+                self.positions[:n] = saved
+        return fitness
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        del self.positions, self.fitness, self.zones
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._shms = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,88 @@
+import numpy as np
+
+
+def dominates(A, B):
+    """(len(A), len(B)) matrix: True where A[i] Pareto-dominates B[j] (minimization)."""
+    A = A[:, None, :]
+    B = B[None, :, :]
+    return np.all(A <= B, axis=2) & np.any(A < B, axis=2)
+
+
+def dominated_by(A, B, chunk=256):
+    """Mask over B: True where some row of A dominates it.
+
+    A is processed in chunks so memory stays at chunk * len(B) * objectives.
+    """
+    mask = np.zeros(len(B), dtype=bool)
+    for start in range(0, len(A), chunk):
+        mask |= dominates(A[start : start + chunk], B).any(axis=0)
+    return mask
+
+
+def crowding_distance(F):
+    """NSGA-II crowding distance of every row of F (boundary points get inf)."""
+    n, m = F.shape
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    order = np.argsort(F, axis=0)
+    sorted_F = np.take_along_axis(F, order, axis=0)
+    span = sorted_F[-1] - sorted_F[0]
+    span[span == 0] = 1
+
+    distance = np.zeros(n)
+    gaps = (sorted_F[2:] - sorted_F[:-2]) / span
+    np.add.at(distance, order[1:-1].ravel(), gaps.ravel())
+    distance[order[0]] = np.inf
+    distance[order[-1]] = np.inf
+    return distance
+
+
+class ParetoArchive:
+    """Bounded archive of non-dominated (position, objectives) pairs.
+
+    Dominance checks are batched over the whole population; when the archive
+    overflows, the most crowded members are dropped.
+    """
+
+    def __init__(self, capacity, dim, n_obj, dtype=np.float64):
+        self.capacity = capacity
+        self.positions = np.empty((0, dim), dtype=dtype)
+        self.objectives = np.empty((0, n_obj))
+
+    def __len__(self):
+        return len(self.objectives)
+
+    def update(self, positions, objectives):
+        objectives = np.asarray(objectives, dtype=float)
+
+        # Candidates dominated by the archive or by other candidates are dropped
+        keep = ~dominated_by(self.objectives, objectives)
+        positions, objectives = positions[keep], objectives[keep]
+        keep = ~dominated_by(objectives, objectives)
+        positions, objectives = positions[keep], objectives[keep]
+        if len(objectives) == 0:
+            return
+
+        # Archive members dominated by the new candidates are dropped
+        survivors = ~dominated_by(objectives, self.objectives)
+        all_positions = np.concatenate((self.positions[survivors], positions))
+        all_objectives = np.concatenate((self.objectives[survivors], objectives))
+
+        # Duplicated objective vectors are kept once
+        _, unique = np.unique(all_objectives, axis=0, return_index=True)
+        unique = np.sort(unique)
+        all_positions, all_objectives = all_positions[unique], all_objectives[unique]
+
+        if len(all_objectives) > self.capacity:
+            distance = crowding_distance(all_objectives)
+            keep = np.sort(np.argsort(-distance, kind="stable")[: self.capacity])
+            all_positions, all_objectives = all_positions[keep], all_objectives[keep]
+
+        self.positions, self.objectives = all_positions, all_objectives
+
+
+def select_from_front(solution, weights):
+    """Best path of a multi-objective run for one weighting of the objectives."""
+    best = np.argmin(solution["pareto_front"] @ np.asarray(weights, dtype=float))
+    return solution["pareto_paths"][best], solution["pareto_front"][best]
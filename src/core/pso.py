@@ -0,0 +1,43 @@
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+class ParticleSwarmOptimizer(Optimizer):
+    """Particle Swarm Optimization with linearly decreasing inertia weight."""
+
+    name = "PSO"
+    state_keys = Optimizer.state_keys + ("Velocities", "Pbest_pos", "Pbest_score")
+
+    def __init__(
+        self, UAV, SearchAgents, Max_iter, seed=None, w=(0.9, 0.4), c1=2.0, c2=2.0, v_max=0.2, **kwargs
+    ):
+        super().__init__(UAV, SearchAgents, Max_iter, seed, **kwargs)
+        self.w = w  # (start, end) inertia weight
+        self.c1 = c1  # cognitive coefficient
+        self.c2 = c2  # social coefficient
+        self.v_max = v_max * (self.ub - self.lb)  # velocity limit per dimension
+
+    def initialize(self):
+        super().initialize()
+        self.Velocities = np.zeros_like(self.Positions)
+        self.Pbest_pos = np.copy(self.Positions)
+        self.Pbest_score = np.full(len(self.Positions), np.inf)
+
+    def observe(self, Positions, fitness):
+        improved = fitness < self.Pbest_score
+        self.Pbest_score[improved] = fitness[improved]
+        self.Pbest_pos[improved] = Positions[improved]
+
+    def update(self, iter):
+        w = self.w[0] - (self.w[0] - self.w[1]) * iter / self.Max_iter
+        r1 = self.rng.random(self.Positions.shape, dtype=self.dtype)
+        r2 = self.rng.random(self.Positions.shape, dtype=self.dtype)
+
+        self.Velocities = (
+            w * self.Velocities
+            + self.c1 * r1 * (self.Pbest_pos - self.Positions)
+            + self.c2 * r2 * (self.best_pos - self.Positions)
+        )
+        np.clip(self.Velocities, -self.v_max, self.v_max, out=self.Velocities)
+        self.Positions += self.Velocities
@@ -0,0 +1,149 @@
+import numpy as np
+
+from .obj_fun import ObjFun, SAFE_DISTANCE, W1, W2, check_collisions, line_cylinder_intersection
+from .optimizer import get_bounds
+
+
+def smooth_objective(waypoints, UAV, margin=1.0, samples=1):
+    """Smooth surrogate of ObjFun and its analytic gradient.
+
+    Path length plus the penetration depth into the (inflated) no-fly zones
+    of every waypoint and of ``samples - 1`` points inside every segment, so
+    that segments cutting through a zone are pushed out as well. The
+    gradient of the depth pushes the point radially out of the cylinder and
+    is shared by the two ends of its segment.
+    """
+    eps = 1e-9
+    path = np.vstack((UAV["S"], waypoints, UAV["G"]))
+
+    # Path length: d|p_k - p_k-1|/dp_k - d|p_k+1 - p_k|/dp_k
+    segments = np.diff(path, axis=0)
+    lengths = np.linalg.norm(segments, axis=1)
+    units = segments / np.maximum(lengths, eps)[:, None]
+    grad = W1 * (units[:-1] - units[1:])
+
+    # Points along every segment: (segments, samples, 3), t = 0 is the waypoint
+    t = np.arange(samples) / samples
+    points = path[:-1, None, :] + t[None, :, None] * segments[:, None, :]
+
+    # Penetration depth in the XY plane of the zones that contain the point
+    zones = np.asarray(UAV["NoFlyZones"], dtype=float)
+    offset = points[:, :, None, :2] - zones[:, :2]
+    distance_xy = np.linalg.norm(offset, axis=3)
+    limit = zones[:, 3] + SAFE_DISTANCE + margin
+    z = points[:, :, None, 2]
+    active = (distance_xy < limit) & (z >= 0) & (z <= zones[:, 2])
+    depth = np.where(active, limit - distance_xy, 0)
+    outward = (np.where(active, 1 / np.maximum(distance_xy, eps), 0)[..., None] * offset).sum(axis=2)
+
+    # Point = (1 - t) * start + t * end of its segment
+    push = np.zeros_like(path[:, :2])
+    push[:-1] += ((1 - t)[None, :, None] * outward).sum(axis=1)
+    push[1:] += (t[None, :, None] * outward).sum(axis=1)
+    grad[:, :2] -= W2 * push[1:-1]
+
+    value = W1 * lengths.sum() + W2 * depth.sum()
+    return value, grad
+
+
+def gradient_refine(waypoints, UAV, max_iter=200, step=1.0, tol=1e-6, margin=1.0, samples=1):
+    """Projected gradient descent with backtracking on smooth_objective."""
+    lb, ub = get_bounds(UAV)
+    lb = lb.reshape(-1, UAV["PointDim"])
+    ub = ub.reshape(-1, UAV["PointDim"])
+
+    waypoints = np.array(waypoints, dtype=float)
+    value, grad = smooth_objective(waypoints, UAV, margin, samples)
+    for _ in range(max_iter):
+        # Backtracking line search
+        while step > 1e-8:
+            candidate = np.clip(waypoints - step * grad, lb, ub)
+            new_value, new_grad = smooth_objective(candidate, UAV, margin, samples)
+            if new_value < value:
+                break
+            step *= 0.5
+        else:
+            break
+
+        improvement = value - new_value
+        waypoints, value, grad = candidate, new_value, new_grad
+        if improvement < tol:
+            break
+        step *= 2
+    return waypoints
+
+
+def shortcut_path(waypoints, UAV):
+    """Prune waypoints by shortcutting with the segment collision kernel.
+
+    From every kept point the farthest collision-free point is connected
+    directly; the pruned waypoints are spread evenly along the shortcut so
+    that the number of waypoints stays ``UAV["PointNum"]``.
+    """
+    path = np.vstack((UAV["S"], waypoints, UAV["G"])).astype(float)
+    # Keep the same safe distance as the objective
+    zones = np.array(UAV["NoFlyZones"], dtype=float)
+    zones[:, 3] += SAFE_DISTANCE
+
+    def is_free(start, end):
+        return not any(line_cylinder_intersection(start, end, zone) for zone in zones)
+
+    result = [path[0]]
+    i = 0
+    while i < len(path) - 1:
+        j = len(path) - 1
+        while j > i + 1 and not is_free(path[i], path[j]):
+            j -= 1
+        # Spread the pruned waypoints along the segment (i, j)
+        for k in range(1, j - i + 1):
+            t = k / (j - i)
+            result.append((1 - t) * path[i] + t * path[j])
+        i = j
+    return np.array(result[1:-1])
+
+
+def refine_path(best_path, UAV, max_iter=200, shortcut=True, gradient=True, samples=(1, 4)):
+    """Polish a path with shortcutting and gradient descent.
+
+    Gradient descent starts both from the raw path and from its shortcut,
+    once per entry of ``samples`` (points checked per segment by the
+    surrogate), and every descended path is shortcut again. Candidates (and
+    the raw path) are ranked by their number of colliding segments first and
+    by ObjFun second. Returns the refined (PointNum, PointDim) path and its
+    fitness.
+    """
+    raw = np.array(best_path, dtype=float).reshape(-1, UAV["PointDim"])
+
+    starts = [raw]
+    if shortcut:
+        starts.append(shortcut_path(raw, UAV))
+    candidates = starts[1:]
+    if gradient:
+        for start in starts:
+            for count in samples:
+                polished = gradient_refine(start, UAV, max_iter=max_iter, samples=count)
+                candidates.append(polished)
+                if shortcut:
+                    candidates.append(shortcut_path(polished, UAV))
+
+    def rank(path):
+        # Fewer colliding segments always wins, then the lower ObjFun
+        collisions = check_collisions(np.vstack((UAV["S"], path, UAV["G"])), UAV["NoFlyZones"])
+        return collisions, ObjFun(path.flatten(), UAV)
+
+    best, best_rank = raw, rank(raw)
+    for candidate in candidates:
+        candidate_rank = rank(candidate)
+        if candidate_rank < best_rank:
+            best, best_rank = candidate, candidate_rank
+
+    return best, best_rank[1]
+
+
+def refine_solution(solution, UAV, **kwargs):
+    """Refine ``solution["best_path"]`` in place, keeping the raw GWO path."""
+    path, fitness = refine_path(solution["best_path"], UAV, **kwargs)
+    solution["raw_best_path"] = solution["best_path"]
+    solution["best_path"] = path
+    solution["refined_fitness"] = fitness
+    return solution
@@ -6,6 +6,7 @@ def UAV_SetUp():
     UAV["S"] = np.array([10, 10, 25])  # Start position (x,y,z)
     UAV["G"] = np.array([500, 500, 300])  # End position (x,y,z)
     UAV["PointNum"] = 10  # Number of navigation points for the UAV
+    UAV["CruiseAltitude"] = 100  # Preferred flight altitude (multi-objective mode)
 
     UAV["PointDim"] = UAV["S"].shape[0]
 
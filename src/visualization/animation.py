@@ -2,10 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import matplotlib.animation as animation
-from mpl_toolkits.mplot3d.art3d import Line3D, Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Line3D, Line3DCollection, Poly3DCollection
 import time
-from tqdm import tqdm
-import subprocess
 
 from .config import (
     COLORS,
@@ -17,7 +15,11 @@ from .config import (
     setup_plot_style,
     add_colorbar,
 )
-from .utils import create_cylinder, precompute_animation_data
+from .utils import (
+    create_cylinder,
+    precompute_animation_data,
+    precompute_decimated_animation_data,
+)
 
 
 class PathAnimator:
@@ -160,9 +162,83 @@ class PathAnimator:
 
         return anim, total_frames
 
+    def create_decimated_animation(
+        self,
+        all_paths,
+        fps=FPS,
+        duration=DURATION,
+        rotation_angle=ROTATION_ANGLE,
+        top_k=50,
+        sample=150,
+        seed=0,
+    ):
+        """Create an animation whose cost is bounded for large packs and long runs.
+
+        Only ``top_k`` + ``sample`` wolves are drawn, iterations are decimated to
+        fit ``fps * duration`` frames, and all paths are a single
+        ``Line3DCollection`` updated with one call per frame.
+        """
+        data = precompute_decimated_animation_data(
+            all_paths, self.UAV, fps, duration, top_k=top_k, sample=sample, seed=seed
+        )
+
+        self.path_collection = Line3DCollection(data["paths"][0], alpha=1, linewidths=2)
+        self.ax.add_collection3d(self.path_collection, autolim=False)
+        self.nav_points = self.ax.plot(
+            [], [], [], "o", markersize=6, alpha=1, color=COLORS["secondary"]["blue"]
+        )[0]
+
+        # Add text elements
+        self.fitness_text = self.fig.text(
+            0.1,
+            0.65,
+            "",
+            fontsize=14,
+            color=COLORS["main"]["primary1"],
+            fontweight="bold",
+        )
+        self.iteration_text = self.fig.text(
+            0.1,
+            0.60,
+            "",
+            fontsize=14,
+            color=COLORS["main"]["primary1"],
+            fontweight="bold",
+        )
+
+        total_frames = len(data["paths"])
+
+        def animate(frame):
+            self.path_collection.set_segments(data["paths"][frame])
+            self.path_collection.set_color(data["colors"][frame])
+
+            nav_points = data["nav_points"][frame].reshape(-1, 3)
+            self.nav_points.set_data(nav_points[:, 0], nav_points[:, 1])
+            self.nav_points.set_3d_properties(nav_points[:, 2])
+
+            self.fitness_text.set_text(f'Best Fitness: {data["best_fitness"][frame]:.2f}')
+            self.iteration_text.set_text(
+                f'Iteration: {data["iteration"][frame] + 1}/{len(all_paths)}'
+            )
+
+            # Update view angle for rotation
+            azimuth = (frame / total_frames) * rotation_angle
+            self.ax.view_init(elev=20, azim=azimuth)
+
+            return [self.path_collection, self.nav_points, self.fitness_text, self.iteration_text]
+
+        anim = FuncAnimation(
+            self.fig, animate, frames=total_frames, interval=1000 / fps, blit=False
+        )
+
+        return anim, total_frames
+
 
 def save_animation(anim, total_frames, filename="path_animation.mp4", fps=30):
     """Save the animation to a file."""
+    import subprocess
+    from tqdm import tqdm
+
     writer = animation.FFMpegWriter(
         fps=fps,
         metadata=dict(artist="GWO Path Planner"),
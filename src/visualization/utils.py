@@ -1,5 +1,4 @@
 import numpy as np
-from tqdm import tqdm
 import json
 from ..utils.encoders import NumpyEncoder
 from .config import COLORS
@@ -19,6 +18,8 @@ def load_animation_data(filename='animation_export.json'):
 
 def interpolate_paths(paths, frames_per_iteration):
     """Interpolate between path points for smooth animation."""
+    from tqdm import tqdm
+
     interpolated_paths = []
     total_frames = (len(paths) - 1) * frames_per_iteration
     
@@ -59,7 +60,9 @@ def create_cylinder(center_x, center_y, height, radius, resolution=20):
 
 def precompute_animation_data(all_paths, UAV, obj_fun, fps, duration):
     """Precompute all animation data for smoother rendering."""
-    frames_per_iteration = int(fps * duration / len(all_paths))
+    from tqdm import tqdm
+
+    frames_per_iteration = max(1, int(fps * duration / len(all_paths)))
     smooth_paths = interpolate_paths(all_paths, frames_per_iteration)
     
     precomputed_data = []
@@ -98,6 +101,77 @@ def precompute_animation_data(all_paths, UAV, obj_fun, fps, duration):
     
     return precomputed_data
 
+def precompute_decimated_animation_data(all_paths, UAV, fps, duration,
+                                        top_k=50, sample=150, seed=0):
+    """Precompute a bounded animation: subsampled wolves and decimated iterations.
+
+    Keeps the ``top_k`` best wolves of the last iteration plus ``sample`` random
+    others, and picks at most ``fps * duration`` evenly spaced iterations, so
+    the cost no longer depends on the size of the run. ``best_fitness`` is
+    the best of the whole pack at the iteration a frame belongs to.
+    """
+    from ..core.obj_fun import ObjFunBatch
+
+    budget = max(1, int(fps * duration))
+    iterations = np.unique(
+        np.linspace(0, len(all_paths) - 1, min(len(all_paths), budget)).round().astype(int)
+    )
+    frames_per_iteration = max(1, budget // len(iterations))
+
+    # Wolves: best of the last iteration plus a random sample of the others
+    last = np.asarray(all_paths[-1], dtype=float)
+    order = np.argsort(ObjFunBatch(last.reshape(len(last), -1), UAV))
+    others = order[top_k:]
+    rng = np.random.default_rng(seed)
+    wolves = np.concatenate((
+        order[:top_k],
+        rng.choice(others, min(sample, len(others)), replace=False),
+    ))
+
+    # (iterations, wolves, points, 3), then linear interpolation between them
+    selected = np.stack([np.asarray(all_paths[i], dtype=float)[wolves] for i in iterations])
+    if len(selected) > 1:
+        t = (np.arange(frames_per_iteration) / frames_per_iteration)[None, :, None, None, None]
+        waypoints = (1 - t) * selected[:-1, None] + t * selected[1:, None]
+        waypoints = np.concatenate((
+            waypoints.reshape(-1, *selected.shape[1:]), selected[-1:]
+        ))
+        frame_iterations = np.append(np.repeat(iterations[:-1], frames_per_iteration), iterations[-1])
+    else:
+        waypoints, frame_iterations = selected, iterations
+
+    frames, num_wolves = waypoints.shape[:2]
+    fitness = ObjFunBatch(waypoints.reshape(frames * num_wolves, -1), UAV).reshape(frames, num_wolves)
+    min_fitness = fitness.min(axis=1, keepdims=True)
+    max_fitness = fitness.max(axis=1, keepdims=True)
+    norm_fitnesses = (fitness - min_fitness) / (max_fitness - min_fitness + 1e-10)
+
+    # Best fitness of the whole pack (not only the drawn wolves) at the chosen iterations
+    pack_best = {
+        i: ObjFunBatch(np.asarray(all_paths[i], dtype=float).reshape(len(all_paths[i]), -1), UAV).min()
+        for i in iterations
+    }
+
+    start = np.broadcast_to(UAV['S'], (frames, num_wolves, 1, 3))
+    goal = np.broadcast_to(UAV['G'], (frames, num_wolves, 1, 3))
+
+    return {
+        'paths': np.concatenate((start, waypoints, goal), axis=2),
+        'nav_points': waypoints,
+        'colors': get_path_colors(norm_fitnesses),
+        'best_fitness': np.array([pack_best[i] for i in frame_iterations]),
+        'iteration': frame_iterations,
+    }
+
+def get_path_colors(qualities):
+    """Vectorized get_path_color."""
+    palette = np.array([
+        COLORS['secondary']['red'],
+        COLORS['secondary']['yellow'],
+        COLORS['secondary']['green']
+    ])
+    return palette[np.digitize(qualities, [0.33, 0.67])]
+
 def get_path_color(quality):
     """Get color based on path quality."""
     if quality < 0.33: